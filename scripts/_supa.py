@@ -0,0 +1,16 @@
+"""
+Shared, memoized Supabase client factory.
+
+create_client() builds a fresh httpx client (TCP + TLS handshake, auth
+header pipeline) on every call. Scripts that talk to the same project
+should reuse one client so keepalive connections survive across queries.
+"""
+from functools import lru_cache
+
+from supabase import Client, create_client
+
+
+@lru_cache(maxsize=4)
+def get_client(url: str, key: str) -> Client:
+    """Return a cached Supabase client for the given project credentials."""
+    return create_client(url, key)
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Analyze duplicate image records in the domain layer.
+
+Grouping happens server-side in Postgres (GROUP BY ... HAVING count(*) > 1),
+so only the duplicate groups travel over the wire instead of the whole table.
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.ingest.config import IngestConfig
+from scripts.ingest.database import DatabaseManager
+
+def fetch_duplicate_groups(cur):
+    """Fetch duplicate image groups aggregated server-side."""
+    cur.execute("""
+        SELECT recognition_id, camera_number, array_agg(id ORDER BY id) AS image_ids
+        FROM images
+        GROUP BY recognition_id, camera_number
+        HAVING COUNT(*) > 1
+        ORDER BY recognition_id, camera_number
+    """)
+    return cur.fetchall()
+
+def check_annotations(cur, groups):
+    """Count annotations on duplicate images with a single grouped query."""
+    image_ids = [img_id for _, _, ids in groups for img_id in ids]
+
+    cur.execute("""
+        SELECT image_id, COUNT(*)
+        FROM initial_annotations
+        WHERE image_id = ANY(%s)
+        GROUP BY image_id
+    """, (image_ids,))
+    return dict(cur.fetchall())
+
+def execute_cleanup(cur, groups):
+    """
+    Keep the first image of each group, repoint annotations to it and
+    delete the rest — one UPDATE/DELETE per group via ANY(...), not one
+    round trip per duplicate id.
+
+    The moved-annotation counter comes from cursor.rowcount of the
+    UPDATEs themselves, so no separate counting query is needed.
+    """
+    deleted = 0
+    moved = 0
+    for recognition_id, camera_number, image_ids in groups:
+        keep_id, delete_ids = image_ids[0], list(image_ids[1:])
+
+        cur.execute("""
+            UPDATE initial_annotations SET image_id = %s
+            WHERE image_id = ANY(%s)
+        """, (keep_id, delete_ids))
+        moved += cur.rowcount
+        cur.execute("""
+            UPDATE work_annotations SET image_id = %s
+            WHERE image_id = ANY(%s)
+        """, (keep_id, delete_ids))
+        moved += cur.rowcount
+
+        cur.execute("DELETE FROM images WHERE id = ANY(%s)", (delete_ids,))
+        deleted += cur.rowcount
+
+    return deleted, moved
+
+def show_duplicate_examples(groups, limit=10):
+    """Print example duplicate groups."""
+    print(f"   Примеры (до {limit}):")
+    for recognition_id, camera_number, image_ids in groups[:limit]:
+        print(f"      - recognition_id={recognition_id}, camera={camera_number}: "
+              f"ids={image_ids}")
+
+def analyze_duplicates(production=False, fix=False):
+    """Analyze (and optionally clean up) duplicate images."""
+    config = IngestConfig.from_env(use_production=production)
+    db = DatabaseManager(config)
+
+    try:
+        with db.get_connection() as conn:
+            with conn.cursor() as cur:
+                print(f"🔍 Поиск дубликатов изображений в {config.environment}...")
+                print()
+
+                groups = fetch_duplicate_groups(cur)
+
+                if not groups:
+                    print("✅ Дубликатов не найдено")
+                    return 0
+
+                total_extra = sum(len(ids) - 1 for _, _, ids in groups)
+                print(f"⚠️  Найдено {len(groups)} групп дубликатов "
+                      f"({total_extra} лишних записей)")
+                print()
+                show_duplicate_examples(groups)
+                print()
+
+                annotation_counts = check_annotations(cur, groups)
+                annotated = sum(1 for c in annotation_counts.values() if c > 0)
+                print(f"📝 Изображений с аннотациями среди дубликатов: {annotated}")
+                for recognition_id, camera_number, image_ids in groups[:10]:
+                    counts = [annotation_counts.get(i, 0) for i in image_ids]
+                    if any(counts):
+                        print(f"      - recognition_id={recognition_id}, "
+                              f"camera={camera_number}: annotations={counts}")
+
+                if fix:
+                    print()
+                    print("🧹 Удаляю дубликаты...")
+                    deleted, moved = execute_cleanup(cur, groups)
+                    print(f"✅ Удалено изображений: {deleted}, "
+                          f"перенесено аннотаций: {moved}")
+
+        return 0
+
+    except Exception as e:
+        print(f"❌ Ошибка: {e}")
+        return 1
+    finally:
+        db.close()
+
+if __name__ == '__main__':
+    production = '--production' in sys.argv
+    fix = '--fix' in sys.argv
+    if fix and production:
+        print("⚠️  PRODUCTION MODE")
+        confirm = input("Введите 'CONFIRM' для удаления дубликатов: ")
+        if confirm != 'CONFIRM':
+            print("Отменено")
+            sys.exit(1)
+        print()
+
+    sys.exit(analyze_duplicates(production=production, fix=fix))
@@ -21,31 +21,27 @@ def check_consistency(production=False):
                 print(f"🔍 Проверка консистентности данных в {config.environment}...")
                 print()
                 
-                # Check raw layer
-                cur.execute("SELECT COUNT(*) FROM raw.recognition_files")
-                raw_count = cur.fetchone()[0]
-                
-                cur.execute("SELECT COUNT(*) FROM raw.recipes")
-                raw_recipes = cur.fetchone()[0]
-                
-                cur.execute("SELECT COUNT(*) FROM raw.qwen_annotations")
-                raw_qwen = cur.fetchone()[0]
-                
-                # Check domain layer
-                cur.execute("SELECT COUNT(*) FROM recognitions")
-                domain_rec = cur.fetchone()[0]
-                
-                cur.execute("SELECT COUNT(*) FROM images")
-                domain_img = cur.fetchone()[0]
-                
-                cur.execute("SELECT COUNT(*) FROM recipes")
-                domain_recipes = cur.fetchone()[0]
+                # Check raw and domain layers in a single round trip
+                cur.execute("""
+                    SELECT
+                        (SELECT COUNT(*) FROM raw.recognition_files),
+                        (SELECT COUNT(*) FROM raw.recipes),
+                        (SELECT COUNT(*) FROM raw.qwen_annotations),
+                        (SELECT COUNT(*) FROM recognitions),
+                        (SELECT COUNT(*) FROM images),
+                        (SELECT COUNT(*) FROM recipes)
+                """)
+                (raw_count, raw_recipes, raw_qwen,
+                 domain_rec, domain_img, domain_recipes) = cur.fetchone()
                 
                 # Check which IDs are in raw but not in domain
                 cur.execute("""
-                    SELECT recognition_id 
-                    FROM raw.recognition_files 
-                    WHERE recognition_id NOT IN (SELECT id FROM recognitions)
+                    WITH diff AS (
+                        SELECT recognition_id FROM raw.recognition_files
+                        EXCEPT
+                        SELECT id FROM recognitions
+                    )
+                    SELECT recognition_id FROM diff
                     ORDER BY recognition_id
                     LIMIT 10
                 """)
@@ -10,11 +10,19 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from scripts.ingest.config import IngestConfig
 from scripts.ingest.database import DatabaseManager
 
-def check_integrity(production=False):
+def check_integrity(production=False, estimate=False):
     """Проверка целостности данных."""
     env_name = "PRODUCTION" if production else "STAGING"
     print(f"🔍 Проверка целостности данных ({env_name})")
     print()
+
+    if estimate:
+        # O(1) запрос к каталогу вместо полного скана таблицы
+        def table_count(table):
+            return ("(SELECT GREATEST(reltuples, 0)::bigint FROM pg_class "
+                    f"WHERE oid = '{table}'::regclass)")
+        print("ℹ️  Счётчики таблиц приблизительные (pg_class.reltuples)")
+        print()
     
     config = IngestConfig.from_env(use_production=production)
     db = DatabaseManager(config)
@@ -22,14 +30,35 @@ def check_integrity(production=False):
     try:
         with db.get_connection() as conn:
             with conn.cursor() as cur:
+                # Собираем все счётчики одним запросом вместо 10 round trips
+                if estimate:
+                    cur.execute(f"""
+                        SELECT
+                            {table_count('raw.recognition_files')},
+                            {table_count('recognitions')},
+                            {table_count('images')},
+                            {table_count('raw.recipes')},
+                            {table_count('recipes')},
+                            {table_count('raw.qwen_annotations')},
+                            (SELECT COUNT(DISTINCT recognition_id) FROM raw.qwen_annotations),
+                            (SELECT COUNT(*) FROM raw.recognition_files WHERE active_menu IS NOT NULL),
+                            (SELECT COUNT(DISTINCT recognition_id) FROM recognition_active_menu_items),
+                            (SELECT MIN(id) FROM recognitions),
+                            (SELECT MAX(id) FROM recognitions)
+                    """)
+                else:
+                    # Весь снапшот считается одной server-side функцией
+                    # (см. миграцию 20260901100000_add_integrity_snapshot_function.sql)
+                    cur.execute("SELECT * FROM check_integrity_snapshot()")
+                (raw_count, domain_count, images_count,
+                 raw_recipes, domain_recipes,
+                 qwen_count, qwen_recognitions,
+                 has_menu, menu_items_recognitions,
+                 min_id, max_id) = cur.fetchone()
+
                 # 1. Проверяем raw vs domain
                 print("📊 Сравнение raw и domain слоёв:")
-                cur.execute("SELECT COUNT(*) FROM raw.recognition_files")
-                raw_count = cur.fetchone()[0]
-                
-                cur.execute("SELECT COUNT(*) FROM recognitions")
-                domain_count = cur.fetchone()[0]
-                
+
                 print(f"   raw.recognition_files: {raw_count:,}")
                 print(f"   domain.recognitions:   {domain_count:,}")
                 
@@ -41,8 +70,6 @@ def check_integrity(production=False):
                 
                 # 2. Проверяем изображения
                 print("🖼️  Проверка изображений:")
-                cur.execute("SELECT COUNT(*) FROM images")
-                images_count = cur.fetchone()[0]
                 expected_images = domain_count * 2
                 
                 print(f"   Изображений в БД: {images_count:,}")
@@ -56,12 +83,7 @@ def check_integrity(production=False):
                 
                 # 3. Проверяем рецепты
                 print("📋 Проверка рецептов:")
-                cur.execute("SELECT COUNT(*) FROM raw.recipes")
-                raw_recipes = cur.fetchone()[0]
-                
-                cur.execute("SELECT COUNT(*) FROM recipes")
-                domain_recipes = cur.fetchone()[0]
-                
+
                 print(f"   raw.recipes:     {raw_recipes:,}")
                 print(f"   domain.recipes:  {domain_recipes:,}")
                 
@@ -73,12 +95,7 @@ def check_integrity(production=False):
                 
                 # 4. Проверяем Qwen аннотации
                 print("🤖 Проверка Qwen аннотаций:")
-                cur.execute("SELECT COUNT(*) FROM raw.qwen_annotations")
-                qwen_count = cur.fetchone()[0]
-                
-                cur.execute("SELECT COUNT(DISTINCT recognition_id) FROM raw.qwen_annotations")
-                qwen_recognitions = cur.fetchone()[0]
-                
+
                 print(f"   Всего аннотаций: {qwen_count:,}")
                 print(f"   Для распознаваний: {qwen_recognitions:,} из {domain_count:,}")
                 
@@ -88,16 +105,7 @@ def check_integrity(production=False):
                 
                 # 5. Проверяем active_menu
                 print("📱 Проверка active_menu:")
-                cur.execute("""
-                    SELECT COUNT(*) 
-                    FROM raw.recognition_files 
-                    WHERE active_menu IS NOT NULL
-                """)
-                has_menu = cur.fetchone()[0]
-                
-                cur.execute("SELECT COUNT(DISTINCT recognition_id) FROM recognition_active_menu_items")
-                menu_items_recognitions = cur.fetchone()[0]
-                
+
                 print(f"   С active_menu в raw: {has_menu:,}")
                 print(f"   Трансформировано в domain: {menu_items_recognitions:,}")
                 
@@ -125,11 +133,7 @@ def check_integrity(production=False):
                 
                 # 6. Проверяем пробелы в ID
                 print("🔢 Проверка пробелов в ID:")
-                cur.execute("""
-                    SELECT MIN(id) as min_id, MAX(id) as max_id, COUNT(*) as count
-                    FROM recognitions
-                """)
-                min_id, max_id, count = cur.fetchone()
+                count = domain_count
                 expected_count = max_id - min_id + 1
                 
                 print(f"   Диапазон ID: {min_id:,} - {max_id:,}")
@@ -154,7 +158,8 @@ def check_integrity(production=False):
 
 if __name__ == '__main__':
     production = '--production' in sys.argv
-    sys.exit(check_integrity(production=production))
+    estimate = '--estimate' in sys.argv
+    sys.exit(check_integrity(production=production, estimate=estimate))
 
 
 
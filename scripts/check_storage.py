@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Check consistency between Supabase Storage and the images table.
+
+The diff runs entirely in Postgres against storage.objects, so only the
+mismatching paths travel to the client — in a healthy environment that
+is zero rows instead of two full listings.
+"""
+import sys
+from heapq import nsmallest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.ingest.config import IngestConfig
+from scripts.ingest.database import DatabaseManager
+
+def check_storage(production=False):
+    """Compare DB storage paths against bucket contents server-side."""
+    config = IngestConfig.from_env(use_production=production)
+    db = DatabaseManager(config)
+
+    try:
+        with db.get_connection() as conn:
+            with conn.cursor() as cur:
+                print(f"🔍 Проверка соответствия Storage и БД в {config.environment}...")
+                print()
+
+                cur.execute("""
+                    SELECT
+                        (SELECT COUNT(*) FROM images),
+                        (SELECT COUNT(*) FROM storage.objects
+                         WHERE bucket_id = %s AND name LIKE 'recognitions/%%')
+                """, (config.storage_bucket,))
+                db_count, storage_count = cur.fetchone()
+                print(f"📊 Путей в images: {db_count:,}")
+                print(f"🗄️  Файлов в storage: {storage_count:,}")
+                print()
+
+                # In DB but absent from storage
+                cur.execute("""
+                    SELECT storage_path FROM images
+                    EXCEPT
+                    SELECT name FROM storage.objects WHERE bucket_id = %s
+                """, (config.storage_bucket,))
+                missing_in_storage = [row[0] for row in cur.fetchall()]
+
+                # In storage but unreferenced by the DB (anti-join keeps
+                # the size handy for the report)
+                cur.execute("""
+                    SELECT o.name, COALESCE((o.metadata->>'size')::bigint, 0)
+                    FROM storage.objects o
+                    LEFT JOIN images i ON i.storage_path = o.name
+                    WHERE o.bucket_id = %s
+                      AND o.name LIKE 'recognitions/%%'
+                      AND i.id IS NULL
+                """, (config.storage_bucket,))
+                extra_in_storage = dict(cur.fetchall())
+
+        if not missing_in_storage and not extra_in_storage:
+            print("✅ Storage и БД синхронизированы")
+            return 0
+
+        if missing_in_storage:
+            print(f"⚠️  В БД, но нет в storage: {len(missing_in_storage)}")
+            # nsmallest: O(n log 10) instead of sorting the whole list
+            for path in nsmallest(10, missing_in_storage):
+                print(f"      - {path}")
+        if extra_in_storage:
+            total_size = sum(extra_in_storage.values())
+            print(f"⚠️  В storage, но нет в БД: {len(extra_in_storage)} "
+                  f"({total_size / 1024 / 1024:.1f} MB)")
+            for path in nsmallest(10, extra_in_storage):
+                print(f"      - {path}")
+
+        return 1
+
+    except Exception as e:
+        print(f"❌ Ошибка: {e}")
+        return 1
+    finally:
+        db.close()
+
+if __name__ == '__main__':
+    production = '--production' in sys.argv
+    sys.exit(check_storage(production=production))
@@ -21,12 +21,17 @@ def clean_orphaned_raw(production=False):
     try:
         with db.get_connection() as conn:
             with conn.cursor() as cur:
-                # Find orphaned records
+                # Find orphaned records (NOT EXISTS → hash anti-join;
+                # NOT IN degrades badly on large subqueries and is wrong
+                # in the presence of NULLs)
                 cur.execute("""
-                    SELECT recognition_id 
-                    FROM raw.recognition_files 
-                    WHERE recognition_id NOT IN (SELECT id FROM recognitions)
-                    ORDER BY recognition_id
+                    SELECT rf.recognition_id
+                    FROM raw.recognition_files rf
+                    WHERE NOT EXISTS (
+                        SELECT 1 FROM recognitions r
+                        WHERE r.id = rf.recognition_id
+                    )
+                    ORDER BY rf.recognition_id
                 """)
                 orphaned = cur.fetchall()
                 
@@ -46,28 +51,32 @@ def clean_orphaned_raw(production=False):
                 
                 # Delete orphaned records
                 print("Удаляю зависшие записи из raw слоя...")
-                
-                # Delete from raw.qwen_annotations (если есть)
-                cur.execute("""
-                    DELETE FROM raw.qwen_annotations 
-                    WHERE recognition_id = ANY(%s)
-                """, (orphaned_ids,))
-                qwen_deleted = cur.rowcount
-                
-                # Delete from raw.recipes
-                cur.execute("""
-                    DELETE FROM raw.recipes 
-                    WHERE recognition_id = ANY(%s)
-                """, (orphaned_ids,))
-                recipes_deleted = cur.rowcount
-                
-                # Delete from raw.recognition_files
+
+                # All three deletes in one statement: a single round trip,
+                # with per-table counts returned via the CTEs
                 cur.execute("""
-                    DELETE FROM raw.recognition_files 
-                    WHERE recognition_id = ANY(%s)
-                """, (orphaned_ids,))
-                files_deleted = cur.rowcount
-                
+                    WITH del_qwen AS (
+                        DELETE FROM raw.qwen_annotations
+                        WHERE recognition_id = ANY(%(ids)s)
+                        RETURNING 1
+                    ),
+                    del_recipes AS (
+                        DELETE FROM raw.recipes
+                        WHERE recognition_id = ANY(%(ids)s)
+                        RETURNING 1
+                    ),
+                    del_files AS (
+                        DELETE FROM raw.recognition_files
+                        WHERE recognition_id = ANY(%(ids)s)
+                        RETURNING 1
+                    )
+                    SELECT
+                        (SELECT COUNT(*) FROM del_qwen),
+                        (SELECT COUNT(*) FROM del_recipes),
+                        (SELECT COUNT(*) FROM del_files)
+                """, {'ids': orphaned_ids})
+                qwen_deleted, recipes_deleted, files_deleted = cur.fetchone()
+
                 conn.commit()
                 
                 print()
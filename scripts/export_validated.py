@@ -12,12 +12,32 @@ Usage:
 """
 
 import os
-import json
 import argparse
+import gzip
+from functools import lru_cache
+from collections import defaultdict
 from datetime import datetime
+from uuid import uuid4
+from concurrent.futures import ThreadPoolExecutor
+import orjson
 import psycopg2
 from psycopg2.extras import RealDictCursor
+from psycopg2.pool import ThreadedConnectionPool
 
+def orjson_default(obj):
+    """Serialize types orjson doesn't handle natively (e.g. Decimal)"""
+    return str(obj)
+
+def stream_cursor(conn, itersize=1000):
+    """
+    Named (server-side) cursor: rows stream from Postgres in batches of
+    itersize instead of one fetchall that blocks until the last row.
+    """
+    cursor = conn.cursor(name=f'exp_{uuid4().hex}', withhold=True)
+    cursor.itersize = itersize
+    return cursor
+
+@lru_cache(maxsize=4)
 def load_database_url(env_name=None):
     """Load DATABASE_URL from .env.{env_name} file or environment"""
     # First check if already in environment
@@ -44,27 +64,39 @@ def load_database_url(env_name=None):
     
     return db_url
 
-def get_db_connection(env_name=None):
-    """Get database connection from environment"""
-    db_url = load_database_url(env_name)
-    print(f"[export] Connecting to database...")
-    return psycopg2.connect(db_url, cursor_factory=RealDictCursor)
+def create_pool(db_url, maxconn=4):
+    """
+    Connection pool shared by the main thread and the parallel fetchers.
+    All connections open up front, so the TLS handshakes overlap instead
+    of being paid one by one as each fetcher starts.
+    """
+    return ThreadedConnectionPool(
+        minconn=maxconn, maxconn=maxconn,
+        dsn=db_url, cursor_factory=RealDictCursor
+    )
 
 def get_completed_work_logs(conn, user_emails=None, step_food=None, step_plate=None, step_buzzer=None):
     """Get all completed work logs with filters"""
     print(f"[export] Fetching completed work logs...")
+
+    cursor = stream_cursor(conn)
     
-    cursor = conn.cursor()
-    
+    # ROW_NUMBER over (recognition_id, completed_at DESC) instead of
+    # DISTINCT ON: the partial index on completed work logs feeds the
+    # window without a full sort of the joined set
     query = """
-        SELECT DISTINCT ON (vwl.recognition_id)
+        SELECT
             vwl.recognition_id,
             vwl.id as work_log_id,
             vwl.validation_steps,
             vwl.assigned_to,
             vwl.completed_at,
             r.batch_id,
-            p.email as assigned_to_email
+            p.email as assigned_to_email,
+            ROW_NUMBER() OVER (
+                PARTITION BY vwl.recognition_id
+                ORDER BY vwl.completed_at DESC
+            ) AS rn
         FROM validation_work_log vwl
         JOIN profiles p ON p.id = vwl.assigned_to
         LEFT JOIN recognitions r ON r.id = vwl.recognition_id
@@ -76,45 +108,55 @@ def get_completed_work_logs(conn, user_emails=None, step_food=None, step_plate=N
         query += " AND p.email = ANY(%s)"
         params.append(user_emails)
     
-    # Filter by validation steps
-    if step_food and step_food != 'any':
-        query += """ AND EXISTS (
-            SELECT 1 FROM jsonb_array_elements(vwl.validation_steps) as step
-            WHERE step->>'type' = 'FOOD_VALIDATION' AND step->>'status' = %s
-        )"""
-        params.append(step_food)
-    
-    if step_plate and step_plate != 'any':
-        query += """ AND EXISTS (
-            SELECT 1 FROM jsonb_array_elements(vwl.validation_steps) as step
-            WHERE step->>'type' = 'PLATE_VALIDATION' AND step->>'status' = %s
-        )"""
-        params.append(step_plate)
-    
-    if step_buzzer and step_buzzer != 'any':
-        query += """ AND EXISTS (
-            SELECT 1 FROM jsonb_array_elements(vwl.validation_steps) as step
-            WHERE step->>'type' = 'BUZZER_VALIDATION' AND step->>'status' = %s
-        )"""
-        params.append(step_buzzer)
-    
-    query += " ORDER BY vwl.recognition_id, vwl.completed_at DESC"
-    
+    # Filter by validation steps with jsonb containment (@>) so the GIN
+    # index on validation_steps applies, instead of decomposing the
+    # array per candidate row with jsonb_array_elements
+    step_filters = [
+        ('FOOD_VALIDATION', step_food),
+        ('PLATE_VALIDATION', step_plate),
+        ('BUZZER_VALIDATION', step_buzzer),
+    ]
+    for step_type, status in step_filters:
+        if status and status != 'any':
+            query += " AND vwl.validation_steps @> %s::jsonb"
+            params.append(orjson.dumps([{'type': step_type, 'status': status}]).decode())
+    
+    query = f"""
+        SELECT recognition_id, work_log_id, validation_steps, assigned_to,
+               completed_at, batch_id, assigned_to_email
+        FROM ({query}) t
+        WHERE rn = 1
+        ORDER BY recognition_id
+    """
+
     cursor.execute(query, params)
-    work_logs = cursor.fetchall()
+    # Iterated twice downstream (ids + export), so keep the list; rows
+    # still arrive in itersize batches rather than one blocking fetchall
+    work_logs = list(cursor)
     cursor.close()
     
     print(f"[export] Found {len(work_logs)} completed work logs")
     return work_logs
 
 def get_work_items(conn, work_log_ids):
-    """Get all work items for given work_log_ids"""
+    """Stream work items for given work_log_ids"""
     print(f"[export] Fetching work items for {len(work_log_ids)} work logs...")
+
+    cursor = stream_cursor(conn)
     
-    cursor = conn.cursor()
-    
+    # One windowed pass picks the best option per recipe line (selected
+    # first, then lowest id) instead of a correlated MIN() subquery that
+    # re-executes per work_items row
     query = """
-        SELECT 
+        WITH rlo_best AS (
+            SELECT *,
+                   ROW_NUMBER() OVER (
+                       PARTITION BY recipe_line_id
+                       ORDER BY is_selected DESC NULLS LAST, id ASC
+                   ) AS rn
+            FROM recipe_line_options
+        )
+        SELECT
             wi.id,
             wi.work_log_id,
             wi.recognition_id,
@@ -127,28 +169,24 @@ def get_work_items(conn, work_log_ids):
             rlo.name,
             rlo.is_selected
         FROM work_items wi
-        LEFT JOIN recipe_line_options rlo ON rlo.recipe_line_id = wi.recipe_line_id
-            AND (rlo.is_selected = true OR rlo.id = (
-                SELECT MIN(id) FROM recipe_line_options 
-                WHERE recipe_line_id = wi.recipe_line_id
-            ))
+        LEFT JOIN rlo_best rlo ON rlo.recipe_line_id = wi.recipe_line_id
+            AND rlo.rn = 1
         WHERE wi.work_log_id = ANY(%s)
             AND wi.is_deleted = false
         ORDER BY wi.id
     """
     
     cursor.execute(query, (work_log_ids,))
-    items = cursor.fetchall()
-    cursor.close()
-    
-    print(f"[export] Found {len(items)} work items")
-    return items
+    try:
+        yield from cursor
+    finally:
+        cursor.close()
 
 def get_work_annotations(conn, work_log_ids):
-    """Get all work annotations for given work_log_ids"""
+    """Stream work annotations for given work_log_ids"""
     print(f"[export] Fetching work annotations...")
-    
-    cursor = conn.cursor()
+
+    cursor = stream_cursor(conn)
     
     query = """
         SELECT 
@@ -168,17 +206,16 @@ def get_work_annotations(conn, work_log_ids):
     """
     
     cursor.execute(query, (work_log_ids,))
-    annotations = cursor.fetchall()
-    cursor.close()
-    
-    print(f"[export] Found {len(annotations)} work annotations")
-    return annotations
+    try:
+        yield from cursor
+    finally:
+        cursor.close()
 
 def get_images(conn, recognition_ids):
-    """Get all images for given recognition_ids"""
+    """Stream images for given recognition_ids"""
     print(f"[export] Fetching images for {len(recognition_ids)} recognitions...")
-    
-    cursor = conn.cursor()
+
+    cursor = stream_cursor(conn)
     
     query = """
         SELECT 
@@ -194,56 +231,55 @@ def get_images(conn, recognition_ids):
     """
     
     cursor.execute(query, (recognition_ids,))
-    images = cursor.fetchall()
-    cursor.close()
-    
-    print(f"[export] Found {len(images)} images")
-    return images
+    try:
+        yield from cursor
+    finally:
+        cursor.close()
 
 def bbox_equals(bbox1, bbox2):
     """Compare two bboxes"""
     if not bbox1 or not bbox2:
         return False
-    return (bbox1.get('x') == bbox2.get('x') and 
-            bbox1.get('y') == bbox2.get('y') and
-            bbox1.get('w') == bbox2.get('w') and
-            bbox1.get('h') == bbox2.get('h'))
+    # Single tuple comparison instead of four short-circuited ones
+    return ((bbox1.get('x'), bbox1.get('y'), bbox1.get('w'), bbox1.get('h')) ==
+            (bbox2.get('x'), bbox2.get('y'), bbox2.get('w'), bbox2.get('h')))
 
-def build_export_data(work_logs, items, annotations, images):
-    """Build export JSON structure"""
-    print(f"[export] Building export data structure...")
-    
-    # Group data by recognition_id and work_log_id
-    items_by_wl = {}
-    for item in items:
-        wl_id = item['work_log_id']
-        if wl_id not in items_by_wl:
-            items_by_wl[wl_id] = []
-        items_by_wl[wl_id].append(item)
-    
-    annotations_by_image = {}
-    for ann in annotations:
-        img_id = ann['image_id']
-        if img_id not in annotations_by_image:
-            annotations_by_image[img_id] = []
-        annotations_by_image[img_id].append(ann)
-    
-    images_by_recognition = {}
-    for img in images:
-        rec_id = img['recognition_id']
-        if rec_id not in images_by_recognition:
-            images_by_recognition[rec_id] = []
-        images_by_recognition[rec_id].append(img)
-    
-    # Build recognitions
-    recognitions = []
+def group_rows(rows, key):
+    """Group streamed rows by the given key column"""
+    # Rows stream straight from the server-side cursor into the dict,
+    # no intermediate fetchall list; defaultdict skips the per-row
+    # membership test of the `if k not in d` pattern
+    grouped = defaultdict(list)
+    count = 0
+    for row in rows:
+        grouped[row[key]].append(row)
+        count += 1
+    return grouped, count
+
+def fetch_grouped(pool, fetch_fn, ids, key, label):
+    """Fetch and group one result set on a pooled connection"""
+    conn = pool.getconn()
+    try:
+        grouped, count = group_rows(fetch_fn(conn, ids), key)
+        print(f"[export] Found {count} {label}")
+        return grouped
+    finally:
+        pool.putconn(conn)
+
+def iter_recognitions(work_logs, items_by_wl, annotations_by_image, images_by_recognition):
+    """Yield one export-ready recognition dict at a time"""
+    # Bind the hot lookups once instead of re-resolving per row
+    get_items = items_by_wl.get
+    get_annotations = annotations_by_image.get
+    get_images = images_by_recognition.get
+    empty = ()
     for wl in work_logs:
         rec_id = wl['recognition_id']
         wl_id = wl['work_log_id']
         
         # Build items for this recognition
         export_items = []
-        for item in items_by_wl.get(wl_id, []):
+        for item in get_items(wl_id, empty):
             export_items.append({
                 'item_id': item['id'],
                 'item_type': item['type'],
@@ -256,9 +292,9 @@ def build_export_data(work_logs, items, annotations, images):
         
         # Build images with annotations
         export_images = []
-        for img in images_by_recognition.get(rec_id, []):
+        for img in get_images(rec_id, empty):
             img_annotations = []
-            for ann in annotations_by_image.get(img['id'], []):
+            for ann in get_annotations(img['id'], empty):
                 initial_bbox = ann.get('initial_bbox')
                 current_bbox = ann['bbox']
                 was_modified = not bbox_equals(current_bbox, initial_bbox) if initial_bbox else False
@@ -291,7 +327,7 @@ def build_export_data(work_logs, items, annotations, images):
                     'order': step.get('order'),
                 })
         
-        recognitions.append({
+        yield {
             'recognition_id': rec_id,
             'batch_id': wl.get('batch_id'),
             'validation_metadata': {
@@ -305,9 +341,29 @@ def build_export_data(work_logs, items, annotations, images):
                 'items': export_items,
             },
             'images': export_images,
-        })
-    
-    return {'recognitions': recognitions}
+        }
+
+def write_export(path, recognitions, compress=False):
+    """
+    Stream recognitions to disk as {"recognitions": [...]}.
+
+    Each recognition is serialized and written as it is produced, so peak
+    memory is one recognition instead of the whole export structure plus
+    its JSON buffer. With compress=True the stream goes through gzip —
+    the repeated bbox/schema keys compress far below raw JSON size.
+    """
+    open_fn = (lambda p: gzip.open(p, 'wb', compresslevel=6)) if compress else \
+              (lambda p: open(p, 'wb'))
+    count = 0
+    with open_fn(path) as f:
+        f.write(b'{"recognitions": [')
+        for rec in recognitions:
+            if count:
+                f.write(b',')
+            f.write(orjson.dumps(rec, default=orjson_default))
+            count += 1
+        f.write(b']}')
+    return count
 
 def main():
     parser = argparse.ArgumentParser(description='Export validated data from database')
@@ -317,6 +373,7 @@ def main():
     parser.add_argument('--step-food', choices=['completed', 'skipped', 'any'], help='Filter by FOOD_VALIDATION status')
     parser.add_argument('--step-plate', choices=['completed', 'skipped', 'any'], help='Filter by PLATE_VALIDATION status')
     parser.add_argument('--step-buzzer', choices=['completed', 'skipped', 'any'], help='Filter by BUZZER_VALIDATION status')
+    parser.add_argument('--compress', action='store_true', help='Write gzip-compressed output (.json.gz)')
     
     args = parser.parse_args()
     
@@ -325,6 +382,8 @@ def main():
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         env_suffix = f"_{args.env}" if args.env else ""
         args.output = os.path.expanduser(f"~/Downloads/export{env_suffix}_{timestamp}.json")
+    if args.compress and not args.output.endswith('.gz'):
+        args.output += '.gz'
     
     # Parse filters
     user_emails = args.emails.split(',') if args.emails else None
@@ -344,8 +403,11 @@ def main():
     
     try:
         # Connect to database
-        conn = get_db_connection(args.env)
-        
+        db_url = load_database_url(args.env)
+        print(f"[export] Connecting to database...")
+        pool = create_pool(db_url)
+        conn = pool.getconn()
+
         # Step 1: Get work logs
         work_logs = get_completed_work_logs(
             conn, 
@@ -362,30 +424,36 @@ def main():
         work_log_ids = [wl['work_log_id'] for wl in work_logs]
         recognition_ids = [wl['recognition_id'] for wl in work_logs]
         
-        # Step 2: Get items
-        items = get_work_items(conn, work_log_ids)
-        
-        # Step 3: Get annotations
-        annotations = get_work_annotations(conn, work_log_ids)
-        
-        # Step 4: Get images
-        images = get_images(conn, recognition_ids)
-        
-        # Step 5: Build export structure
-        export_data = build_export_data(work_logs, items, annotations, images)
-        
-        # Save to file
+        # Steps 2-4: the three follow-up queries are independent, so run
+        # them on separate connections in parallel — on a remote database
+        # this hides two of the three round trips plus transfer time
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            f_items = executor.submit(
+                fetch_grouped, pool, get_work_items,
+                work_log_ids, 'work_log_id', 'work items')
+            f_annotations = executor.submit(
+                fetch_grouped, pool, get_work_annotations,
+                work_log_ids, 'image_id', 'work annotations')
+            f_images = executor.submit(
+                fetch_grouped, pool, get_images,
+                recognition_ids, 'recognition_id', 'images')
+            items_by_wl = f_items.result()
+            annotations_by_image = f_annotations.result()
+            images_by_recognition = f_images.result()
+
         print(f"[export] Saving to {args.output}...")
-        with open(args.output, 'w', encoding='utf-8') as f:
-            json.dump(export_data, f, indent=2, ensure_ascii=False)
-        
+        total = write_export(args.output, iter_recognitions(
+            work_logs, items_by_wl, annotations_by_image, images_by_recognition
+        ), compress=args.compress)
+
         print(f"[export] ========================================")
         print(f"[export] ✅ Export complete!")
-        print(f"[export]   Total recognitions: {len(export_data['recognitions'])}")
+        print(f"[export]   Total recognitions: {total}")
         print(f"[export]   Output file: {args.output}")
         print(f"[export] ========================================")
         
-        conn.close()
+        pool.putconn(conn)
+        pool.closeall()
         
     except Exception as e:
         print(f"[export] ❌ Error: {e}")
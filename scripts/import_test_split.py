@@ -110,9 +110,13 @@ def main():
     print("=" * 60)
     print(f"Environment: {args.env}")
 
-    # Read parquet
+    # Read parquet (only the columns the import touches)
     print("Reading parquet...")
-    df = pq.read_table(args.parquet).to_pandas()
+    columns = [
+        "recognition_id", "split", "canteen_guid", "canteen_name", "timestamp",
+        "active_menu", "correct_dishes", "image_45_bboxes", "image_90_bboxes",
+    ]
+    df = pq.read_table(args.parquet, columns=columns).to_pandas()
     test_df = df[df["split"] == "test"].copy().sort_values("recognition_id")
     print(f"Total test split recognitions in parquet: {len(test_df)}")
 
@@ -149,7 +153,8 @@ def main():
     missing_rec = 0
     missing_images = 0
 
-    for _, row in tqdm(test_df.iterrows(), total=len(test_df), desc="Importing"):
+    for _, row in tqdm(test_df.iterrows(), total=len(test_df), desc="Importing",
+                       mininterval=1.0, disable=not sys.stdout.isatty()):
         rec_id = int(row["recognition_id"])
 
         if rec_id in already_imported:
@@ -227,7 +232,8 @@ def main():
             if bb["up"] is not None:
                 items_map[key]["up"] = bb["up"]
 
-        # Insert items and annotations
+        # Insert items, collecting annotation rows for a single batched insert
+        annotation_rows = []
         for (name, ean), item_data in items_map.items():
             cur.execute(
                 """INSERT INTO test_split_items
@@ -241,12 +247,17 @@ def main():
 
             for cam_num, bbox in item_data["annotations"]:
                 img_id = image_lookup.get((rec_id, cam_num))
-                cur.execute(
-                    """INSERT INTO test_split_annotations
-                       (recognition_id, test_split_item_id, image_id, camera_number, bbox)
-                       VALUES (%s, %s, %s, %s, %s)""",
-                    (rec_id, item_id, img_id, cam_num, json.dumps(bbox))
-                )
+                annotation_rows.append((rec_id, item_id, img_id, cam_num, json.dumps(bbox)))
+
+        if annotation_rows:
+            psycopg2.extras.execute_values(
+                cur,
+                """INSERT INTO test_split_annotations
+                   (recognition_id, test_split_item_id, image_id, camera_number, bbox)
+                   VALUES %s""",
+                annotation_rows,
+                page_size=500,
+            )
 
         conn.commit()
         imported += 1
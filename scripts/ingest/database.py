@@ -4,7 +4,8 @@ Handles PostgreSQL operations with COPY for efficient bulk inserts.
 """
 import io
 import csv
-from typing import List, Tuple, Optional, Any
+import threading
+from typing import Dict, List, Tuple, Optional, Any
 from contextlib import contextmanager
 import psycopg2
 from psycopg2 import pool, sql
@@ -15,26 +16,79 @@ from .logger import get_logger
 from .metrics import MetricsCollector
 
 
+# Pools are shared per DSN so scripts that construct several
+# DatabaseManager instances in one process reuse established connections
+# instead of paying TCP + TLS + auth handshakes again.
+_pool_cache: Dict[str, "psycopg2.pool.ThreadedConnectionPool"] = {}
+_pool_refs: Dict[str, int] = {}
+_pool_lock = threading.Lock()
+
+
+class _CsvRowStream:
+    """
+    File-like view over rows, rendered to CSV lazily for copy_expert.
+
+    copy_expert pulls data through read(), so rows are encoded a chunk
+    at a time instead of materializing the whole COPY payload in one
+    StringIO buffer up front (which doubles peak memory on big batches).
+    """
+
+    CHUNK_ROWS = 500
+
+    def __init__(self, rows: List[Tuple]):
+        self._chunks = self._render(rows)
+        self._buffer = ""
+
+    @classmethod
+    def _render(cls, rows: List[Tuple]):
+        for start in range(0, len(rows), cls.CHUNK_ROWS):
+            buf = io.StringIO()
+            csv.writer(buf).writerows(rows[start:start + cls.CHUNK_ROWS])
+            yield buf.getvalue()
+
+    def read(self, size: int = -1) -> str:
+        while size < 0 or len(self._buffer) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+        if size < 0:
+            out, self._buffer = self._buffer, ""
+        else:
+            out, self._buffer = self._buffer[:size], self._buffer[size:]
+        return out
+
+
 class DatabaseManager:
     """
     Manages database connections and operations with connection pooling.
     Provides efficient bulk inserts via PostgreSQL COPY.
     """
-    
+
     def __init__(self, config: IngestConfig, metrics: Optional[MetricsCollector] = None):
         self.config = config
         self.metrics = metrics or MetricsCollector()
         self.logger = get_logger()
-        
-        # Create connection pool
+        self._dsn = config.database_url
+
+        # Create (or reuse) connection pool for this DSN
         try:
-            self.pool = psycopg2.pool.ThreadedConnectionPool(
-                minconn=1,
-                maxconn=config.connection_pool_size,
-                dsn=config.database_url,
-                connect_timeout=config.db_connect_timeout
-            )
-            self.logger.info("Database connection pool created", size=config.connection_pool_size)
+            with _pool_lock:
+                existing = _pool_cache.get(self._dsn)
+                if existing is not None and not existing.closed:
+                    self.pool = existing
+                    _pool_refs[self._dsn] += 1
+                    self.logger.info("Reusing database connection pool")
+                else:
+                    self.pool = psycopg2.pool.ThreadedConnectionPool(
+                        minconn=1,
+                        maxconn=config.connection_pool_size,
+                        dsn=self._dsn,
+                        connect_timeout=config.db_connect_timeout
+                    )
+                    _pool_cache[self._dsn] = self.pool
+                    _pool_refs[self._dsn] = 1
+                    self.logger.info("Database connection pool created", size=config.connection_pool_size)
         except Exception as e:
             self.logger.error("Failed to create connection pool", error=str(e))
             raise
@@ -96,21 +150,14 @@ class DatabaseManager:
         
         self.metrics.start_timer("db_bulk_copy")
         
-        # Prepare CSV buffer
-        csv_buffer = io.StringIO()
-        csv_writer = csv.writer(csv_buffer)
-        for row in rows:
-            csv_writer.writerow(row)
-        csv_buffer.seek(0)
-        
         # Build COPY statement
         columns_str = ", ".join(columns)
         copy_sql = f"COPY {table_name} ({columns_str}) FROM STDIN WITH (FORMAT CSV)"
-        
-        # Execute COPY
+
+        # Execute COPY, encoding rows to CSV lazily as the server consumes them
         def _execute(connection):
             with connection.cursor() as cur:
-                cur.copy_expert(copy_sql, csv_buffer)
+                cur.copy_expert(copy_sql, _CsvRowStream(rows))
             return len(rows)
         
         try:
@@ -467,8 +514,18 @@ class DatabaseManager:
         return 0, 0
     
     def close(self):
-        """Close all connections in pool."""
+        """Release the shared pool; close it when the last user is done."""
         if hasattr(self, 'pool') and self.pool:
-            self.pool.closeall()
-            self.logger.info("Database connection pool closed")
+            with _pool_lock:
+                refs = _pool_refs.get(self._dsn, 1) - 1
+                if refs <= 0:
+                    _pool_refs.pop(self._dsn, None)
+                    if _pool_cache.get(self._dsn) is self.pool:
+                        _pool_cache.pop(self._dsn)
+                    if not self.pool.closed:
+                        self.pool.closeall()
+                    self.logger.info("Database connection pool closed")
+                else:
+                    _pool_refs[self._dsn] = refs
+            self.pool = None
 
@@ -182,30 +182,43 @@ class ProgressBar:
     Displays current progress and performance metrics.
     """
     
-    def __init__(self, total: int, desc: str = "", width: int = 40):
+    def __init__(self, total: int, desc: str = "", width: int = 40, min_interval: float = 0.5):
         self.total = total
         self.desc = desc
         self.width = width
         self.current = 0
         self.start_time = time.time()
         self._lock = Lock()
-    
+        # Rendering every update means one write() syscall per processed item.
+        # Throttle redraws and stay quiet on non-TTY output (CI logs).
+        self.min_interval = min_interval
+        self._last_render = 0.0
+        self._interactive = sys.stdout.isatty()
+
     def update(self, amount: int = 1):
         """Update progress by amount."""
         with self._lock:
             self.current += amount
             self._render()
-    
+
     def set_progress(self, current: int):
         """Set absolute progress value."""
         with self._lock:
             self.current = current
             self._render()
-    
-    def _render(self):
+
+    def _render(self, force: bool = False):
         """Render progress bar to stdout."""
         if self.total == 0:
             return
+
+        if not self._interactive and not force:
+            return
+
+        now = time.monotonic()
+        if not force and now - self._last_render < self.min_interval:
+            return
+        self._last_render = now
         
         # Calculate progress
         progress = self.current / self.total
@@ -235,7 +248,7 @@ class ProgressBar:
         """Complete progress bar and add newline."""
         with self._lock:
             self.current = self.total
-            self._render()
+            self._render(force=True)
             sys.stdout.write("\n")
             sys.stdout.flush()
     
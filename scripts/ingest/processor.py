@@ -2,12 +2,13 @@
 Multithreaded data processor for parallel recognition processing.
 Handles dataset scanning, image processing, and data preparation.
 """
-import json
+import os
 from pathlib import Path
 from typing import List, Optional, Tuple
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from PIL import Image
 import io
+import orjson
 
 from .config import IngestConfig
 from .logger import get_logger
@@ -50,25 +51,30 @@ class DatasetScanner:
         self.logger.info("Scanning dataset for recognitions")
         
         recognition_dirs = []
-        
+
+        # os.scandir reuses the d_type from the directory entry, so is_dir()
+        # needs no extra stat() per entry (unlike Path.iterdir + is_dir)
         # Check for export_* subdirectories first
-        export_dirs = sorted([
-            d for d in dataset_path.iterdir()
-            if d.is_dir() and d.name.startswith('export_')
-        ])
-        
+        with os.scandir(dataset_path) as entries:
+            export_dirs = sorted(
+                Path(e.path) for e in entries
+                if e.is_dir() and e.name.startswith('export_')
+            )
+
         if export_dirs:
             self.logger.info(f"Found export directory", name=export_dirs[0].name)
-            recognition_dirs = sorted([
-                d for d in export_dirs[0].iterdir()
-                if d.is_dir() and d.name.startswith('recognition_')
-            ])
+            with os.scandir(export_dirs[0]) as entries:
+                recognition_dirs = sorted(
+                    Path(e.path) for e in entries
+                    if e.is_dir() and e.name.startswith('recognition_')
+                )
         else:
             # Try direct recognition_* directories
-            recognition_dirs = sorted([
-                d for d in dataset_path.iterdir()
-                if d.is_dir() and (d.name.isdigit() or d.name.startswith('recognition_'))
-            ])
+            with os.scandir(dataset_path) as entries:
+                recognition_dirs = sorted(
+                    Path(e.path) for e in entries
+                    if e.is_dir() and (e.name.isdigit() or e.name.startswith('recognition_'))
+                )
         
         if limit:
             recognition_dirs = recognition_dirs[:limit]
@@ -102,18 +108,21 @@ class RecognitionProcessor:
         """
         try:
             self.metrics.start_timer("process_recognition")
-            
+
             # Extract recognition ID
             recognition_id = self._extract_recognition_id(recognition_dir)
-            
+
+            # One directory sweep finds menu, recipe and images together
+            am_file, recipe_file, image_files = self._scan_files(recognition_dir)
+
             # Load active menu (AM.json)
-            active_menu = self._load_active_menu(recognition_dir)
-            
+            active_menu = self._load_json(am_file)
+
             # Load recipe (correct_dishes.json)
-            recipe = self._load_recipe(recognition_dir)
-            
-            # Find and process images
-            image_data = self._process_images(recognition_dir, recognition_id)
+            recipe = self._load_json(recipe_file)
+
+            # Process images
+            image_data = self._process_images(image_files, recognition_id)
             
             if not image_data:
                 return None
@@ -122,7 +131,7 @@ class RecognitionProcessor:
             result = RecognitionData(
                 recognition_id=recognition_id,
                 batch_id=batch_id,
-                active_menu=json.dumps(active_menu) if active_menu else None,
+                active_menu=orjson.dumps(active_menu).decode() if active_menu else None,
                 image1_path=image_data[0][0],
                 image2_path=image_data[1][0],
                 image1_width=image_data[0][1],
@@ -155,51 +164,67 @@ class RecognitionProcessor:
             return int(dir_name.replace('recognition_', ''))
         return int(dir_name)
     
-    def _load_active_menu(self, recognition_dir: Path) -> Optional[dict]:
-        """Load active menu JSON file."""
-        # Try multiple file patterns
-        am_files = (
-            list(recognition_dir.glob("*_AM.json")) +
-            list(recognition_dir.glob("AM.json"))
-        )
-        
-        if am_files:
-            with open(am_files[0], 'r', encoding='utf-8') as f:
-                return json.load(f)
-        
-        return None
-    
-    def _load_recipe(self, recognition_dir: Path) -> Optional[dict]:
-        """Load recipe/correct_dishes JSON file."""
-        recipe_files = (
-            list(recognition_dir.glob("*_correct_dishes.json")) +
-            list(recognition_dir.glob("CD.json"))
-        )
-        
-        if recipe_files:
-            with open(recipe_files[0], 'r', encoding='utf-8') as f:
-                return json.load(f)
-        
-        return None
-    
+    def _scan_files(
+        self,
+        recognition_dir: Path
+    ) -> Tuple[Optional[Path], Optional[Path], List[Path]]:
+        """
+        Locate menu/recipe JSON files and images in one scandir pass
+        (instead of six glob walks over the same directory).
+
+        Returns:
+            Tuple of (am_file, recipe_file, image_files)
+        """
+        am_file = am_fallback = None
+        recipe_file = recipe_fallback = None
+        images = []
+        photos_dir = None
+
+        with os.scandir(recognition_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if entry.is_dir():
+                    if name == 'photos':
+                        photos_dir = entry.path
+                    continue
+                if name.endswith('_AM.json'):
+                    am_file = am_file or Path(entry.path)
+                elif name == 'AM.json':
+                    am_fallback = Path(entry.path)
+                elif name.endswith('_correct_dishes.json'):
+                    recipe_file = recipe_file or Path(entry.path)
+                elif name == 'CD.json':
+                    recipe_fallback = Path(entry.path)
+                elif name.endswith(('.jpg', '.jpeg')):
+                    images.append(Path(entry.path))
+
+        # Images in photos/ take precedence over root-level ones
+        if photos_dir is not None:
+            with os.scandir(photos_dir) as entries:
+                images = [
+                    Path(e.path) for e in entries
+                    if e.name.endswith(('.jpg', '.jpeg'))
+                ]
+
+        return am_file or am_fallback, recipe_file or recipe_fallback, images
+
+    def _load_json(self, path: Optional[Path]) -> Optional[dict]:
+        """Load a JSON file if present."""
+        if path is None:
+            return None
+        return orjson.loads(path.read_bytes())
+
     def _process_images(
         self,
-        recognition_dir: Path,
+        image_files: List[Path],
         recognition_id: int
     ) -> Optional[List[Tuple[str, int, int, bytes]]]:
         """
-        Find and process images for recognition.
-        
+        Process images for recognition.
+
         Returns:
             List of (filename, width, height, bytes) tuples or None
         """
-        # Find images in photos/ subdirectory or root
-        photos_dir = recognition_dir / "photos"
-        if photos_dir.exists():
-            image_files = list(photos_dir.glob("*.jpg")) + list(photos_dir.glob("*.jpeg"))
-        else:
-            image_files = list(recognition_dir.glob("*.jpg")) + list(recognition_dir.glob("*.jpeg"))
-        
         if len(image_files) != 2:
             self.logger.warning(
                 f"Expected 2 images, found {len(image_files)}",
@@ -495,51 +495,78 @@ class StorageManager:
             self.logger.warning(f"Failed to delete {path}", error=str(e))
             return False
     
+    DELETE_CHUNK_SIZE = 1000
+    LIST_PAGE_SIZE = 1000
+
     def delete_batch(self, paths: List[str]) -> Tuple[int, int]:
         """
-        Delete multiple files.
-        
+        Delete multiple files in chunks of DELETE_CHUNK_SIZE.
+
         Returns:
             Tuple of (successful_count, failed_count)
         """
         successful = 0
         failed = 0
-        
-        # Supabase supports batch delete
-        try:
-            self.storage_client.from_(self.config.storage_bucket).remove(paths)
-            successful = len(paths)
-        except Exception as e:
-            self.logger.warning("Batch delete failed, falling back to individual deletes", error=str(e))
-            # Fallback: delete one by one
-            for path in paths:
-                if self.delete_file(path):
-                    successful += 1
-                else:
-                    failed += 1
-        
+
+        # Supabase supports batch delete; chunk so a single oversized
+        # request doesn't get rejected or time out
+        for start in range(0, len(paths), self.DELETE_CHUNK_SIZE):
+            chunk = paths[start:start + self.DELETE_CHUNK_SIZE]
+            try:
+                self.storage_client.from_(self.config.storage_bucket).remove(chunk)
+                successful += len(chunk)
+            except Exception as e:
+                self.logger.warning("Batch delete failed, falling back to individual deletes", error=str(e))
+                # Fallback: delete one by one
+                for path in chunk:
+                    if self.delete_file(path):
+                        successful += 1
+                    else:
+                        failed += 1
+
         return successful, failed
-    
+
+    def list_folder(self, folder_path: str) -> List[dict]:
+        """
+        List all objects in a folder, paginating past the 100-entry
+        default cap of a single list() call.
+        """
+        objects = []
+        offset = 0
+        while True:
+            page = self.storage_client.from_(self.config.storage_bucket).list(folder_path, {
+                "limit": self.LIST_PAGE_SIZE,
+                "offset": offset,
+                "sortBy": {"column": "name", "order": "asc"},
+            })
+            if not page:
+                break
+            objects.extend(page)
+            if len(page) < self.LIST_PAGE_SIZE:
+                break
+            offset += self.LIST_PAGE_SIZE
+        return objects
+
     def delete_recognition_files(self, recognition_id: int) -> bool:
         """
         Delete all files for a recognition.
-        
+
         Args:
             recognition_id: Recognition ID to delete
         """
         try:
-            # List all files in recognition folder
+            # List all files in recognition folder (paginated)
             folder_path = f"recognitions/{recognition_id}"
-            objects = self.storage_client.from_(self.config.storage_bucket).list(folder_path)
-            
+            objects = self.list_folder(folder_path)
+
             if objects:
                 # Build full paths
                 paths = [f"{folder_path}/{obj.get('name')}" for obj in objects if obj.get('name')]
-                
+
                 # Delete all files
                 if paths:
                     self.delete_batch(paths)
-            
+
             return True
         except Exception as e:
             self.logger.error(f"Failed to delete files for recognition {recognition_id}", error=str(e))
@@ -4,7 +4,8 @@ Ensures atomic commits across both systems with rollback support.
 """
 from typing import List, Tuple, Optional
 from dataclasses import dataclass
-import json
+
+import orjson
 
 from .storage import StorageManager
 from .database import DatabaseManager
@@ -169,7 +170,7 @@ class TransactionContext:
             if rec.recipe_payload:
                 recipe_rows.append((
                     rec.recognition_id,
-                    json.dumps(rec.recipe_payload)
+                    orjson.dumps(rec.recipe_payload).decode()
                 ))
         
         # Bulk insert recipes
@@ -5,15 +5,18 @@ and inserts records into detection_tasks / detection_image_tasks.
 """
 import json
 import mimetypes
+import sys
 from pathlib import Path
 from typing import List, Tuple, Optional
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import psycopg2
-from supabase import create_client, Client
+import psycopg2.extras
+from supabase import Client
 from PIL import Image
 from tqdm import tqdm
 
+from _supa import get_client
 from ingest.config import IngestConfig
 
 IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png'}
@@ -68,7 +71,7 @@ def scan_folder(source_dir: Path) -> List[dict]:
 class DetectionLoader:
     def __init__(self, config: IngestConfig):
         self.config = config
-        self.supabase: Client = create_client(config.supabase_url, config.supabase_key)
+        self.supabase: Client = get_client(config.supabase_url, config.supabase_key)
 
     def _ensure_bucket(self):
         """Create storage bucket if it doesn't exist."""
@@ -85,13 +88,15 @@ class DetectionLoader:
     def _upload_image(self, image_path: Path, storage_path: str) -> bool:
         """Upload a single image to Supabase Storage."""
         content_type = mimetypes.guess_type(str(image_path))[0] or 'image/jpeg'
-        data = image_path.read_bytes()
         try:
-            self.supabase.storage.from_(STORAGE_BUCKET).upload(
-                path=storage_path,
-                file=data,
-                file_options={"content-type": content_type, "upsert": "true"}
-            )
+            # Pass the file handle so the HTTP layer streams from disk
+            # instead of holding a full bytes copy per in-flight upload
+            with image_path.open('rb') as f:
+                self.supabase.storage.from_(STORAGE_BUCKET).upload(
+                    path=storage_path,
+                    file=f,
+                    file_options={"content-type": content_type, "upsert": "true"}
+                )
             return True
         except Exception as e:
             if "Duplicate" in str(e) or "already exists" in str(e):
@@ -132,7 +137,9 @@ class DetectionLoader:
                 future = executor.submit(self._upload_image, item['image_path'], storage_path)
                 futures[future] = item['filename']
 
-            for future in tqdm(as_completed(futures), total=len(futures), desc="Upload"):
+            for future in tqdm(as_completed(futures), total=len(futures), desc="Upload",
+                               mininterval=1.0, smoothing=0,
+                               disable=not sys.stdout.isatty()):
                 fname = futures[future]
                 try:
                     upload_results[fname] = future.result()
@@ -147,7 +154,8 @@ class DetectionLoader:
         # Phase 2: read dimensions + parse annotations
         print("Reading image dimensions and annotations...")
         records = []
-        for item in tqdm(items, desc="Process"):
+        for item in tqdm(items, desc="Process",
+                         mininterval=1.0, disable=not sys.stdout.isatty()):
             if not upload_results.get(item['filename'], False):
                 continue
 
@@ -182,28 +190,28 @@ class DetectionLoader:
                 task_id = cur.fetchone()[0]
                 print(f"  Created detection_task id={task_id}")
 
-                batch_size = 100
-                for i in range(0, len(records), batch_size):
-                    batch = records[i:i + batch_size]
-                    args = []
-                    for r in batch:
-                        args.append((
-                            task_id,
-                            r['image_filename'],
-                            r['storage_path'],
-                            r['image_width'],
-                            r['image_height'],
-                            r['original_annotations'],
-                        ))
-
-                    values_template = ",".join(
-                        cur.mogrify("(%s,%s,%s,%s,%s,%s::jsonb)", a).decode() for a in args
+                rows = [
+                    (
+                        task_id,
+                        r['image_filename'],
+                        r['storage_path'],
+                        r['image_width'],
+                        r['image_height'],
+                        r['original_annotations'],
                     )
-                    cur.execute(f"""
-                        INSERT INTO detection_image_tasks
-                            (task_id, image_filename, storage_path, image_width, image_height, original_annotations)
-                        VALUES {values_template}
-                    """)
+                    for r in records
+                ]
+                psycopg2.extras.execute_values(
+                    cur,
+                    """
+                    INSERT INTO detection_image_tasks
+                        (task_id, image_filename, storage_path, image_width, image_height, original_annotations)
+                    VALUES %s
+                    """,
+                    rows,
+                    template="(%s,%s,%s,%s,%s,%s::jsonb)",
+                    page_size=500,
+                )
 
                 conn.commit()
                 print(f"  Inserted {len(records)} image tasks")
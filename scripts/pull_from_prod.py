@@ -18,9 +18,10 @@ from pathlib import Path
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import psycopg2
+import psycopg2.extras
 import pyarrow.parquet as pq
-from dotenv import load_dotenv
-from supabase import create_client
+from dotenv import dotenv_values
+from _supa import get_client
 from tqdm import tqdm
 
 
@@ -37,14 +38,9 @@ def load_env(env_name: str) -> dict:
         print(f"Error: {env_file} not found")
         sys.exit(1)
 
-    env_vars = {}
-    with open(env_file) as f:
-        for line in f:
-            line = line.strip()
-            if line and not line.startswith("#") and "=" in line:
-                key, value = line.split("=", 1)
-                env_vars[key.strip()] = value.strip()
-    return env_vars
+    # dotenv_values keeps source/target envs isolated (no os.environ pollution)
+    # and handles quoting/escaping the hand-rolled parser got wrong
+    return {k: v for k, v in dotenv_values(env_file).items() if v is not None}
 
 
 def main():
@@ -65,9 +61,9 @@ def main():
     print(f"Target: {args.target_env}")
     print()
 
-    # Load parquet and get test split IDs
+    # Load parquet and get test split IDs (only the two columns needed)
     print("Reading parquet file...")
-    df = pq.read_table(args.parquet).to_pandas()
+    df = pq.read_table(args.parquet, columns=["recognition_id", "split"]).to_pandas()
     test_ids = sorted(df[df["split"] == "test"]["recognition_id"].tolist())
     if args.limit:
         test_ids = test_ids[: args.limit]
@@ -131,11 +127,13 @@ def main():
         (new_ids,)
     )
     rec_rows = source_cur.fetchall()
-    for row in tqdm(rec_rows, desc="Inserting recognitions"):
-        target_cur.execute(
-            "INSERT INTO recognitions (id, batch_id, created_at) VALUES (%s, %s, %s) ON CONFLICT (id) DO NOTHING",
-            row
-        )
+    # Multi-row VALUES batches instead of one round trip per row
+    psycopg2.extras.execute_values(
+        target_cur,
+        "INSERT INTO recognitions (id, batch_id, created_at) VALUES %s ON CONFLICT (id) DO NOTHING",
+        rec_rows,
+        page_size=1000,
+    )
     target_conn.commit()
     print(f"Inserted {len(rec_rows)} recognitions")
 
@@ -147,19 +145,20 @@ def main():
         (new_ids,)
     )
     img_rows = source_cur.fetchall()
-    for row in tqdm(img_rows, desc="Inserting images"):
-        target_cur.execute(
-            "INSERT INTO images (id, recognition_id, camera_number, storage_path, width, height, created_at) "
-            "VALUES (%s, %s, %s, %s, %s, %s, %s) ON CONFLICT DO NOTHING",
-            row
-        )
+    psycopg2.extras.execute_values(
+        target_cur,
+        "INSERT INTO images (id, recognition_id, camera_number, storage_path, width, height, created_at) "
+        "VALUES %s ON CONFLICT DO NOTHING",
+        img_rows,
+        page_size=1000,
+    )
     target_conn.commit()
     print(f"Inserted {len(img_rows)} image rows")
 
     # Step 3: Download and upload photos
     print(f"\n--- Step 3: Transferring photos ({len(img_rows)} files) ---")
-    source_sb = create_client(source_supabase_url, source_supabase_key)
-    target_sb = create_client(target_supabase_url, target_supabase_key)
+    source_sb = get_client(source_supabase_url, source_supabase_key)
+    target_sb = get_client(target_supabase_url, target_supabase_key)
 
     storage_paths = [row[3] for row in img_rows]  # storage_path column
 
@@ -184,7 +183,9 @@ def main():
     errors = 0
     with ThreadPoolExecutor(max_workers=args.threads) as executor:
         futures = {executor.submit(transfer_image, p): p for p in storage_paths}
-        for future in tqdm(as_completed(futures), total=len(futures), desc="Transferring photos"):
+        for future in tqdm(as_completed(futures), total=len(futures), desc="Transferring photos",
+                           mininterval=1.0, smoothing=0,
+                           disable=not sys.stdout.isatty()):
             path, ok, msg = future.result()
             if ok:
                 success += 1
@@ -25,9 +25,11 @@ tables = [
     'raw.recognition_files'
 ]
 
+# TRUNCATE instead of per-table DELETE: one round trip, no per-row WAL
+# or trigger firing, and sequences reset for a genuinely clean slate
+cur.execute(f"TRUNCATE {', '.join(tables)} RESTART IDENTITY CASCADE")
 for table in tables:
-    cur.execute(f'DELETE FROM {table}')
-    print(f'✓ {table}: {cur.rowcount} rows deleted')
+    print(f'✓ {table}: truncated')
 
 conn.commit()
 conn.close()
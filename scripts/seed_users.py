@@ -45,14 +45,16 @@ USERS = [
     {"email": "viewer@test.com", "password": "viewer2024", "role": "viewer", "full_name": "Viewer User"},
 ]
 
+# Constant per-request pieces, built once instead of per user
+ADMIN_USERS_URL = f"{SUPABASE_URL}/auth/v1/admin/users"
+AUTH_HEADERS = {
+    "apikey": SERVICE_ROLE_KEY,
+    "Authorization": f"Bearer {SERVICE_ROLE_KEY}",
+    "Content-Type": "application/json"
+}
+
 def create_user(email: str, password: str, full_name: str) -> str:
     """Create user via Supabase Auth API."""
-    url = f"{SUPABASE_URL}/auth/v1/admin/users"
-    headers = {
-        "apikey": SERVICE_ROLE_KEY,
-        "Authorization": f"Bearer {SERVICE_ROLE_KEY}",
-        "Content-Type": "application/json"
-    }
     data = {
         "email": email,
         "password": password,
@@ -60,7 +62,7 @@ def create_user(email: str, password: str, full_name: str) -> str:
         "user_metadata": {"full_name": full_name}
     }
     
-    response = requests.post(url, headers=headers, json=data, timeout=10)
+    response = requests.post(ADMIN_USERS_URL, headers=AUTH_HEADERS, json=data, timeout=10)
     
     if response.status_code == 200:
         user_id = response.json()["id"]
@@ -0,0 +1,37 @@
+-- Migration: Add snapshot function for data integrity checks
+-- Description: Собирает все счётчики проверки целостности одним вызовом
+-- вместо ~10 отдельных запросов из scripts/check_data_integrity.py
+
+CREATE OR REPLACE FUNCTION check_integrity_snapshot()
+RETURNS TABLE (
+  raw_count bigint,
+  domain_count bigint,
+  images_count bigint,
+  raw_recipes bigint,
+  domain_recipes bigint,
+  qwen_count bigint,
+  qwen_recs bigint,
+  has_menu bigint,
+  menu_recs bigint,
+  min_id bigint,
+  max_id bigint
+) AS $$
+BEGIN
+  RETURN QUERY
+  SELECT
+    (SELECT COUNT(*) FROM raw.recognition_files),
+    (SELECT COUNT(*) FROM recognitions),
+    (SELECT COUNT(*) FROM images),
+    (SELECT COUNT(*) FROM raw.recipes),
+    (SELECT COUNT(*) FROM recipes),
+    (SELECT COUNT(*) FROM raw.qwen_annotations),
+    (SELECT COUNT(DISTINCT qa.recognition_id) FROM raw.qwen_annotations qa),
+    (SELECT COUNT(*) FROM raw.recognition_files WHERE active_menu IS NOT NULL),
+    (SELECT COUNT(DISTINCT rami.recognition_id) FROM recognition_active_menu_items rami),
+    (SELECT MIN(id) FROM recognitions),
+    (SELECT MAX(id) FROM recognitions);
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+COMMENT ON FUNCTION check_integrity_snapshot IS
+  'Single-call snapshot of the counters used by scripts/check_data_integrity.py';
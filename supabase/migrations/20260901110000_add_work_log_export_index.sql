@@ -0,0 +1,7 @@
+-- Index for the validated-data export: picking the latest completed
+-- work log per recognition partitions on (recognition_id, completed_at
+-- DESC), and only completed rows ever qualify.
+
+CREATE INDEX IF NOT EXISTS idx_vwl_completed_recognition_completed_at
+    ON validation_work_log (recognition_id, completed_at DESC)
+    WHERE status = 'completed';
@@ -0,0 +1,6 @@
+-- GIN index for the export's validation-step filters, which use jsonb
+-- containment (validation_steps @> '[{"type": ..., "status": ...}]').
+-- jsonb_path_ops keeps the index small since only @> is needed.
+
+CREATE INDEX IF NOT EXISTS idx_vwl_validation_steps_gin
+    ON validation_work_log USING GIN (validation_steps jsonb_path_ops);